@@ -3,16 +3,210 @@ from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox,
     QPushButton, QFrame
 )
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import (Qt, QTimer, QThread, QObject, Signal, QEvent,
+                            QMutex, QMutexLocker)
 from PySide6.QtGui import QFont
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.animation import FuncAnimation
 from matplotlib.figure import Figure
 import numpy as np
 
 from src.gui.pit_wall_window import PitWallWindow
 from src.lib.tyres import get_tyre_compound_str
 
+# pyqtgraph pushes line updates straight through Qt's paint system (with
+# optional OpenGL) and comfortably outpaces even blitted Matplotlib for
+# high-rate live plots. Fall back to the Matplotlib canvas when it is not
+# installed.
+try:
+    import pyqtgraph as pg
+    pg.setConfigOptions(useOpenGL=True, antialias=False)
+    HAS_PYQTGRAPH = True
+except ImportError:
+    pg = None
+    HAS_PYQTGRAPH = False
+
+# Optional Numba JIT for the series recompute: fuses the stint scan and the
+# health formula into one native pass over the buffer columns with no
+# temporary arrays. The vectorized NumPy path below stays as the fallback.
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    njit = None
+    HAS_NUMBA = False
+
+# Samples kept per driver; the ring buffer overwrites the oldest beyond this.
+_BUFFER_CAP = 1000
+
+
+def _degradation_kernel(tyre, tyre_life, lap, expected_life, out):
+    """Single-pass stint scan + health computation over one driver's columns.
+
+    Tracks the open stint in scalars while walking the arrays once and
+    writes the health percentage into ``out``. Compiled with Numba when
+    available; kept in plain NumPy-compatible Python so it also runs (and
+    stays testable) without it.
+    """
+    compound = -1
+    start_lap = 0
+    start_life = 0
+    prev_life = 0
+    for i in range(tyre.shape[0]):
+        ty = tyre[i]
+        tl = tyre_life[i]
+        lp = lap[i]
+        if i == 0 or ty != compound or tl < prev_life:
+            compound = ty
+            start_lap = lp
+            start_life = tl
+        laps_in_stint = lp - start_lap
+        if laps_in_stint < 0:
+            laps_in_stint = 0
+        effective = (start_life - 1) + laps_in_stint
+        if effective < 0:
+            effective = 0
+        if 0 <= ty < expected_life.shape[0]:
+            expected = expected_life[ty]
+        else:
+            expected = 25
+        if expected > 1:
+            out[i] = 100.0 - effective / (expected - 1.0) * 100.0
+        else:
+            out[i] = 100.0
+        prev_life = tl
+
+
+if HAS_NUMBA:
+    _degradation_kernel = njit(cache=True)(_degradation_kernel)
+
+
+class DriverBuffer:
+    """Fixed-size ring buffer holding one driver's tyre telemetry as
+    structure-of-arrays NumPy columns (frame, tyre, tyre_life, lap).
+
+    Appends are O(1) writes into preallocated arrays, with no per-sample
+    dict allocation and no list slicing when the cap is reached, and the
+    columns are contiguous so the degradation maths can run vectorized.
+    """
+
+    def __init__(self, cap=_BUFFER_CAP):
+        self.cap = cap
+        # Narrow dtypes: compound is a 0-4 enum, tyre life tops out around
+        # 30 laps and race laps fit comfortably in 16 bits, so these columns
+        # take a quarter of the int64 footprint the plot maths would scan.
+        self.frame = np.empty(cap, dtype=np.int32)
+        self.tyre = np.empty(cap, dtype=np.int8)
+        self.tyre_life = np.empty(cap, dtype=np.int8)
+        self.lap = np.empty(cap, dtype=np.int16)
+        self.n = 0      # samples stored (saturates at cap)
+        self.head = 0   # next write position
+        self.total = 0  # samples ever appended (never wraps)
+
+    def __len__(self):
+        return self.n
+
+    def append(self, frame, tyre, tyre_life, lap):
+        """Store one sample, overwriting the oldest once the buffer is full."""
+        i = self.head
+        self.frame[i] = frame
+        self.tyre[i] = tyre
+        self.tyre_life[i] = tyre_life
+        self.lap[i] = lap
+        self.head = (i + 1) % self.cap
+        self.total += 1
+        if self.n < self.cap:
+            self.n += 1
+
+    def since(self, start_total, end_total):
+        """Return the samples appended after ``start_total`` and up to
+        ``end_total`` (capped to capacity) as (frame, tyre, tyre_life, lap),
+        in insertion order.
+
+        The window geometry is derived entirely from ``end_total`` (the
+        write position is always ``total % cap``), so callers can snapshot
+        ``total`` once and get a window consistent with that snapshot even
+        while the ingest thread keeps appending.
+        """
+        k = min(end_total - start_total, self.cap, end_total)
+        head = end_total % self.cap
+        start = (head - k) % self.cap
+        if start + k <= self.cap:
+            sl = slice(start, start + k)
+            return (self.frame[sl], self.tyre[sl], self.tyre_life[sl], self.lap[sl])
+        return tuple(np.concatenate((col[start:], col[:head]))
+                     for col in (self.frame, self.tyre, self.tyre_life, self.lap))
+
+    def last_lap(self):
+        """Return the most recently stored lap, or 0 when empty."""
+        if self.n == 0:
+            return 0
+        return int(self.lap[(self.head - 1) % self.cap])
+
+    def view(self):
+        """Return (frame, tyre, tyre_life, lap) arrays in insertion order."""
+        if self.n < self.cap:
+            return (self.frame[:self.n], self.tyre[:self.n],
+                    self.tyre_life[:self.n], self.lap[:self.n])
+        h = self.head
+        return tuple(np.concatenate((col[h:], col[:h]))
+                     for col in (self.frame, self.tyre, self.tyre_life, self.lap))
+
+
+class TelemetryIngestWorker(QObject):
+    """Ingests telemetry frames into the per-driver ring buffers.
+
+    Lives in its own QThread so the per-frame dict traversal and buffer
+    writes happen off the GUI thread; the window is only poked (data_ready)
+    when new samples have been buffered, and told about roster changes so
+    the combo box can be rebuilt on the GUI thread. Buffer writes are plain
+    scalar stores into preallocated NumPy arrays, so the GIL is sufficient
+    synchronisation for the reader on the GUI thread.
+    """
+
+    data_ready = Signal()
+    roster_changed = Signal(list)
+
+    def __init__(self, driver_data, data_lock, disp_skip=3):
+        super().__init__()
+        self.driver_data = driver_data
+        self.data_lock = data_lock
+        self.disp_skip = disp_skip
+        self._known_drivers = set()
+        self._ingest_count = 0
+
+    def ingest(self, data):
+        """Slot for TelemetryStreamClient.data_received; runs in the worker thread."""
+        if 'frame' not in data or 'drivers' not in data['frame']:
+            return
+        drivers = data['frame']['drivers']
+        frame_index = data.get('frame_index', 0)
+
+        # The roster rarely changes: only look every 30th frame (plus the
+        # very first one) and notify the GUI solely when it actually did.
+        if not self._known_drivers or frame_index % 30 == 0:
+            if drivers.keys() != self._known_drivers:
+                self._known_drivers = set(drivers.keys())
+                self.roster_changed.emit(list(drivers.keys()))
+
+        for code, pos in drivers.items():
+            buffer = self.driver_data.get(code)
+            if buffer is None:
+                # Scalar buffer writes are GIL-safe, but inserting a key can
+                # resize the dict under the GUI thread's iteration - take
+                # the shared lock for the insert.
+                with QMutexLocker(self.data_lock):
+                    buffer = self.driver_data.setdefault(code, DriverBuffer())
+            buffer.append(frame_index, pos.get('tyre', 0),
+                          pos.get('tyre_life', 0), pos.get('lap', 0))
+
+        # Only poke the GUI every disp_skip-th frame so ingest bursts cannot
+        # saturate the painter; data is still buffered at full rate.
+        self._ingest_count += 1
+        if self._ingest_count % self.disp_skip == 0:
+            self.data_ready.emit()
+
 
 class TyreDegradationWindow(PitWallWindow):
     """
@@ -26,7 +220,29 @@ class TyreDegradationWindow(PitWallWindow):
         # PitWallWindow.__init__ calls setup_ui() which expects these
         # attributes to exist.
         self.current_driver = "All Drivers"
-        self.driver_data = {}  # Store data list for each driver
+        self.driver_data = {}  # DriverBuffer per driver code
+        # Guards driver_data's *shape* (inserts from the ingest thread,
+        # clear from Refresh Data) against GUI-thread iteration; buffer
+        # contents themselves need no lock.
+        self._data_lock = QMutex()
+
+        # Colormap lookup built once; cmap calls return a fresh tuple every
+        # time, so keep them out of the per-driver plotting paths.
+        self._colors = [plt.get_cmap('tab10')(i) for i in range(10)]
+        self._driver_colors = {}  # driver code -> colour, fixed on first sight
+
+        # Redraw bookkeeping: ingest marks the plot dirty, the timer only
+        # draws when something changed. disp_skip throttles how often a
+        # telemetry frame may mark the plot dirty during bursts.
+        self._dirty = False
+        self.disp_skip = 3
+
+        # Per-driver plot series, extended incrementally as samples arrive
+        # instead of being recomputed from the full buffer every tick.
+        self._series_cache = {}
+        # Laps as of the last draw; the plot is skipped while they stand still.
+        self._last_plot_laps = None
+        self._max_lap = 0  # highest lap seen, for x-axis synchronization
 
         # Tyre degradation rates (seconds per lap) - based on user example
         self.degradation_rates = {
@@ -47,14 +263,44 @@ class TyreDegradationWindow(PitWallWindow):
             4: 22   # WET
         }
 
+        # Compound-indexed view of expected_tyre_life, so the series maths
+        # can gather expected lives at C level instead of doing a dict
+        # lookup per point.
+        self._exp_life_arr = np.array(
+            [self.expected_tyre_life.get(c, 25) for c in range(5)],
+            dtype=np.int16)
+
         super().__init__()
         self.setWindowTitle("F1 Tyre Degradation Analysis")
         self.setGeometry(200, 200, 1000, 700)
 
-        # Timer for periodic plot updates to reduce lag
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_plot)
-        self.update_timer.start(100)  # Update every 0.1 seconds
+        # Ingest runs in a worker thread so the GUI thread never blocks on
+        # telemetry bursts; on_telemetry_data is intentionally not overridden.
+        # The worker signals back when new samples are buffered and when the
+        # driver roster changes (combo updates must stay on the GUI thread).
+        self._ingest_thread = QThread(self)
+        self._ingest_worker = TelemetryIngestWorker(self.driver_data,
+                                                    self._data_lock,
+                                                    disp_skip=self.disp_skip)
+        self._ingest_worker.moveToThread(self._ingest_thread)
+        self.client.data_received.connect(self._ingest_worker.ingest)
+        self._ingest_worker.data_ready.connect(self._on_data_ready)
+        self._ingest_worker.roster_changed.connect(self._rebuild_driver_combo)
+        self._ingest_thread.start()
+
+        # Periodic redraw driver, polling at 50 ms; update_plot bails out
+        # immediately unless new telemetry arrived, so the plot costs nothing
+        # while the stream is idle. pyqtgraph is driven by a plain QTimer;
+        # the Matplotlib fallback goes through FuncAnimation, whose machinery
+        # owns blitting, background capture and resize invalidation.
+        if HAS_PYQTGRAPH:
+            self.update_timer = QTimer()
+            self.update_timer.timeout.connect(self.update_plot)
+            self.update_timer.start(50)
+        else:
+            self._anim = FuncAnimation(self.figure, self._anim_step,
+                                       interval=50, blit=True,
+                                       cache_frame_data=False)
 
     def setup_ui(self):
         """Create the UI components."""
@@ -72,12 +318,62 @@ class TyreDegradationWindow(PitWallWindow):
         main_layout.addWidget(controls)
 
         # Plot area
-        self.figure = Figure(figsize=(10, 6))
+        if HAS_PYQTGRAPH:
+            self._setup_pyqtgraph_plot(main_layout)
+        else:
+            self._setup_matplotlib_plot(main_layout)
+
+    def _setup_pyqtgraph_plot(self, main_layout):
+        """Create the pyqtgraph plot area (preferred backend)."""
+        self.plot_widget = pg.PlotWidget(background='w')
+        self.plot_widget.setTitle('Tyre Degradation Analysis - All Drivers')
+        self.plot_widget.setLabel('bottom', 'Race Lap')
+        self.plot_widget.setLabel('left', 'Tyre Health (%)')
+        self.plot_widget.showGrid(x=True, y=True, alpha=0.3)
+        self.plot_widget.setXRange(0, 1)
+        self.plot_widget.setYRange(-5, 105)
+        self._pg_legend = self.plot_widget.addLegend(offset=(10, 10))
+        self._pg_title = 'Tyre Degradation Analysis - All Drivers'
+        self._pg_xmax = 1
+        self._pg_ymin = -5
+        self._placeholder_pg = pg.TextItem(
+            "Waiting for telemetry data...\nSelect a driver to view degradation analysis",
+            color='k', anchor=(0.5, 0.5))
+        self._placeholder_pg.setPos(0.5, 50)
+        self.plot_widget.addItem(self._placeholder_pg)
+        self._curves = {}  # driver code -> PlotDataItem
+        main_layout.addWidget(self.plot_widget)
+
+    def _setup_matplotlib_plot(self, main_layout):
+        """Create the Matplotlib plot area (fallback when pyqtgraph is absent)."""
+        # Start from a small raster: the Qt canvas stretches to the widget
+        # anyway, and fewer pixels means proportionally less Agg work per
+        # frame on the initial renders.
+        self.figure = Figure(figsize=(5, 3), dpi=100)
         self.canvas = FigureCanvas(self.figure)
         main_layout.addWidget(self.canvas)
 
-        # Initial plot
-        self.update_plot()
+        # Static axes, created once. Per-driver Line2D artists are cached,
+        # marked animated and blitted by FuncAnimation instead of rebuilding
+        # the whole figure every tick, which skips renderer setup, tick
+        # layout and text layout.
+        self.ax = self.figure.add_subplot(111)
+        self.ax.set_title('Tyre Degradation Analysis - All Drivers')
+        self.ax.set_xlabel('Race Lap')
+        self.ax.set_ylabel('Tyre Health (%)')
+        self.ax.grid(True, alpha=0.3)
+        self.ax.set_xlim(0, 1)
+        self.ax.set_ylim(-5, 105)
+        self._placeholder = self.ax.text(
+            0.5, 0.5, "Waiting for telemetry data...\nSelect a driver to view degradation analysis",
+            ha='center', va='center', transform=self.ax.transAxes, fontsize=14)
+        self.figure.tight_layout()
+
+        self._driver_lines = {}   # driver code -> animated Line2D
+        self._driver_labels = {}  # driver code -> annotation at the line end
+
+        # Initial full render so the renderer exists before any blitting.
+        self.canvas.draw()
 
     def create_header(self):
         """Create the header section."""
@@ -124,176 +420,464 @@ class TyreDegradationWindow(PitWallWindow):
 
         return controls
 
-    def on_telemetry_data(self, data):
-        """Process incoming telemetry data and store per-driver tyre info."""
-        if 'frame' in data and 'drivers' in data['frame']:
-            drivers = data['frame']['drivers']
-
-            # Keep combo: All Drivers + driver codes
-            driver_codes = list(drivers.keys())
-            desired = ["All Drivers"] + driver_codes
-            current_items = [self.driver_combo.itemText(i) for i in range(self.driver_combo.count())]
-            if current_items != desired:
-                try:
-                    self.driver_combo.currentTextChanged.disconnect(self.on_driver_changed)
-                except Exception:
-                    pass
+    def _on_data_ready(self):
+        """Mark the plot dirty; invoked on the GUI thread via the worker's
+        data_ready signal."""
+        self._dirty = True
+
+    def _rebuild_driver_combo(self, driver_codes):
+        """Update the driver combo after a roster change.
+
+        Signals are blocked for the duration instead of disconnecting and
+        reconnecting the slot, and newly joined drivers are added
+        incrementally; a full clear only happens when a driver actually
+        dropped off the roster.
+        """
+        desired = ["All Drivers"] + driver_codes
+        current = [self.driver_combo.itemText(i)
+                   for i in range(self.driver_combo.count())]
+        self.driver_combo.blockSignals(True)
+        try:
+            if set(current) - set(desired):
                 self.driver_combo.clear()
                 self.driver_combo.addItems(desired)
-                self.driver_combo.currentTextChanged.connect(self.on_driver_changed)
-                if self.current_driver not in desired:
-                    self.current_driver = "All Drivers"
-                    self.driver_combo.setCurrentText(self.current_driver)
-
-            # Append telemetry entry for each driver
-            frame_index = data.get('frame_index', 0)
-            for code, pos in drivers.items():
-                if code not in self.driver_data:
-                    self.driver_data[code] = []
-
-                tyre_data = {
-                    'frame': frame_index,
-                    'tyre': pos.get('tyre', 0),
-                    'tyre_life': pos.get('tyre_life', 0),
-                    'lap': pos.get('lap', 0)
-                }
-                self.driver_data[code].append(tyre_data)
-                # cap memory per driver to last 1000 points for performance
-                if len(self.driver_data[code]) > 1000:
-                    self.driver_data[code] = self.driver_data[code][-1000:]
-
-        # Plot updates are now handled by a timer to reduce lag
+            else:
+                existing = set(current)
+                for code in desired:
+                    if code not in existing:
+                        self.driver_combo.addItem(code)
+            if self.current_driver not in desired:
+                self.current_driver = "All Drivers"
+                self._dirty = True
+                self._last_plot_laps = None
+            self.driver_combo.setCurrentText(self.current_driver)
+        finally:
+            self.driver_combo.blockSignals(False)
 
     def on_driver_changed(self, driver):
         """Handle driver selection change."""
         if driver:
             self.current_driver = driver
-            self.update_plot()
+            # Flag the change and let the next animation/timer tick redraw:
+            # calling update_plot here would bypass FuncAnimation in the
+            # Matplotlib backend, so the updated artists would never be
+            # blitted and the axes would sit blank until new telemetry.
+            self._dirty = True
+            self._last_plot_laps = None  # force past the lap short-circuit
 
     def refresh_data(self):
         """Refresh the data collection (clears stored telemetry)."""
-        self.driver_data = {}
-        self.update_plot()
+        # Clear in place: the ingest worker holds a reference to this dict.
+        with QMutexLocker(self._data_lock):
+            self.driver_data.clear()
+        self._series_cache = {}
+        self._last_plot_laps = None
+        self._max_lap = 0
+        if HAS_PYQTGRAPH:
+            for curve in self._curves.values():
+                self.plot_widget.removeItem(curve)
+            self._curves = {}
+            self._pg_legend.clear()
+            self._placeholder_pg.setVisible(True)
+            return
+        for line in self._driver_lines.values():
+            line.remove()
+        for label in self._driver_labels.values():
+            label.remove()
+        self._driver_lines = {}
+        self._driver_labels = {}
+        self._placeholder.set_visible(True)
+        self.canvas.draw()
+
+    def closeEvent(self, event):
+        """Stop the ingest thread before the base class tears down the client."""
+        self._ingest_thread.quit()
+        self._ingest_thread.wait(2000)
+        super().closeEvent(event)
+
+    def _set_updates_paused(self, paused):
+        """Start or stop the periodic redraw driver for the active backend.
+
+        Telemetry keeps buffering (and marking the plot dirty) while paused,
+        so the first tick after resuming catches the plot up.
+        """
+        if HAS_PYQTGRAPH:
+            if paused:
+                self.update_timer.stop()
+            elif not self.update_timer.isActive():
+                self.update_timer.start(50)
+        else:
+            if paused:
+                self._anim.event_source.stop()
+            else:
+                self._anim.event_source.start()
+
+    def hideEvent(self, event):
+        """Spend no CPU on offscreen pixels: stop redraws while hidden."""
+        self._set_updates_paused(True)
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        """Resume redraws when the window becomes visible again."""
+        self._set_updates_paused(False)
+        super().showEvent(event)
+
+    def changeEvent(self, event):
+        """Pause redraws while minimised, resume on restore."""
+        if event.type() == QEvent.WindowStateChange:
+            self._set_updates_paused(
+                bool(self.windowState() & Qt.WindowMinimized))
+        super().changeEvent(event)
+
+    def _anim_step(self, frame):
+        """FuncAnimation callback for the Matplotlib backend.
+
+        Runs the usual gated update and hands FuncAnimation the artists to
+        blit. Even when the update short-circuits (not dirty, no lap advance)
+        the currently visible artists are returned, so the lines are re-drawn
+        on top of whatever background FuncAnimation restores - without this
+        they would vanish after any full render until the next lap advance.
+        """
+        artists = self.update_plot()
+        if artists is None:
+            artists = self._visible_artists()
+        return artists
+
+    def _visible_artists(self):
+        """The animated artists FuncAnimation should blit each step."""
+        artists = []
+        for driver, line in self._driver_lines.items():
+            if line.get_visible():
+                artists.append(line)
+                artists.append(self._driver_labels[driver])
+        return artists
+
+    def _get_driver_artists(self, driver):
+        """Return (line, label) artists for a driver, creating them on first sight.
+
+        The colour is assigned from the order drivers first appear, so it
+        stays stable even when the sorted roster shifts later.
+        """
+        if driver not in self._driver_lines:
+            color = self._color_for(driver)
+            # Antialiased stroking dominates line raster cost; leave it off
+            # for the rapidly-updated live curves.
+            line, = self.ax.plot([], [], linewidth=1.5, color=color,
+                                 alpha=0.9, animated=True, antialiased=False)
+            # Label the line end with an annotation instead of a legend:
+            # legends force a full layout pass, which defeats blitting.
+            label = self.ax.annotate(
+                driver, xy=(0, 0), xytext=(4, 0), textcoords='offset points',
+                color=color, fontsize=8, fontweight='bold', animated=True)
+            self._driver_lines[driver] = line
+            self._driver_labels[driver] = label
+        return self._driver_lines[driver], self._driver_labels[driver]
 
     def update_plot(self):
         """Update the degradation plot for all drivers or a single driver."""
-        self.figure.clear()
-
-        ax = self.figure.add_subplot(111)
-
+        if not self._dirty:
+            return
+        self._dirty = False
+
+        # The curves only change at lap boundaries (lap is the x-axis and
+        # health depends on laps completed in the stint), so skip the whole
+        # pipeline while telemetry streams within a lap.
+        with QMutexLocker(self._data_lock):
+            laps = {code: buf.last_lap()
+                    for code, buf in self.driver_data.items()}
+        if laps and laps == self._last_plot_laps:
+            return
+        self._last_plot_laps = laps
+        # Laps never decrease, so each driver's latest lap is also its max;
+        # this O(drivers) reduction replaces scanning every stored sample.
+        self._max_lap = max(laps.values(), default=0)
+
+        if HAS_PYQTGRAPH:
+            self._update_plot_pyqtgraph()
+        else:
+            return self._update_plot_matplotlib()
+
+    def _update_plot_pyqtgraph(self):
+        """Refresh the pyqtgraph curves; pyqtgraph schedules its own redraw."""
+        if not self.driver_data:
+            self._placeholder_pg.setVisible(True)
+            return
+        self._placeholder_pg.setVisible(False)
+
+        single = self.current_driver if self.current_driver != "All Drivers" else None
+        title = (f'Tyre Degradation Analysis - {single}' if single
+                 else 'Tyre Degradation Analysis - All Drivers')
+        if title != self._pg_title:
+            self.plot_widget.setTitle(title)
+            self._pg_title = title
+
+        y_min = self._pg_ymin
+        with QMutexLocker(self._data_lock):
+            codes = sorted(self.driver_data.keys())
+        for driver in codes:
+            series = self._driver_series(driver)
+            px, py = series['px'], series['py']
+            curve = self._get_driver_curve(driver)
+            visible = len(px) > 0 and (single is None or driver == single)
+            if visible:
+                curve.setData(px, py)
+                y_min = min(y_min, series['y_min'])
+            if curve.isVisible() != visible:
+                curve.setVisible(visible)
+
+        if self._max_lap + 1 > self._pg_xmax:
+            self._pg_xmax = self._max_lap + 1
+            self.plot_widget.setXRange(0, self._pg_xmax)
+        if y_min < self._pg_ymin:
+            self._pg_ymin = y_min - 5
+            self.plot_widget.setYRange(self._pg_ymin, 105)
+
+    def _color_for(self, driver):
+        """Return a driver's plot colour, assigning one on first-ever sight.
+
+        Keeping the assignment here (rather than in the backend artist
+        caches) means a driver keeps its colour across a refresh too.
+        """
+        color = self._driver_colors.get(driver)
+        if color is None:
+            color = self._colors[len(self._driver_colors) % len(self._colors)]
+            self._driver_colors[driver] = color
+        return color
+
+    def _get_driver_curve(self, driver):
+        """Return the PlotDataItem for a driver, creating it on first sight."""
+        if driver not in self._curves:
+            rgb = tuple(int(c * 255) for c in self._color_for(driver)[:3])
+            self._curves[driver] = self.plot_widget.plot(
+                pen=pg.mkPen(rgb, width=1.5), name=driver)
+        return self._curves[driver]
+
+    def _update_plot_matplotlib(self):
+        """Refresh the blitted Matplotlib canvas (fallback backend)."""
         # If no telemetry yet, show placeholder
         if not self.driver_data:
-            ax.text(0.5, 0.5, "Waiting for telemetry data...\nSelect a driver to view degradation analysis",
-                   ha='center', va='center', transform=ax.transAxes, fontsize=14)
-            ax.set_xlim(0, 1)
-            ax.set_ylim(0, 1)
-            self.canvas.draw()
+            if not self._placeholder.get_visible():
+                self._placeholder.set_visible(True)
+                self.canvas.draw()
             return
 
-        # Helper to compute plot points for a single driver's stored data
-        def compute_degradation_series(entries):
-            if not entries:
-                return [], []
-            entries = sorted(entries, key=lambda x: x['frame'])
-            tyre_lives = [e['tyre_life'] for e in entries]
-            compounds = [e['tyre'] for e in entries]
-            laps = [e['lap'] for e in entries]
-
-            # Build stints
-            stints = []
-            current_stint = None
-            previous_life = None
-            for i, (life, compound, lap) in enumerate(zip(tyre_lives, compounds, laps)):
-                # Start a new stint when:
-                # 1) compound changes, or
-                # 2) tyre life resets/decreases (pit stop on same compound)
-                is_new_stint = (
-                    current_stint is None
-                    or current_stint['compound'] != compound
-                    or (previous_life is not None and life < previous_life)
-                )
-
-                if is_new_stint:
-                    current_stint = {
-                        'compound': compound,
-                        'start_life': life,
-                        'start_lap': lap,
-                        'lives': [life],
-                        'laps': [lap]
-                    }
-                    stints.append(current_stint)
-                else:
-                    current_stint['lives'].append(life)
-                    current_stint['laps'].append(lap)
-
-                previous_life = life
-
-            plot_x = []
-            plot_y = []
-            for stint in stints:
-                compound = stint['compound']
-                expected_life = self.expected_tyre_life.get(compound, 25)
-                start_lap = stint['start_lap']
-                start_life = stint['start_life']
-                for life, lap in zip(stint['lives'], stint['laps']):
-                    # Degrade health by race laps completed in this stint
-                    # so the curve decreases gradually lap-by-lap.
-                    # If the tyre is already used at stint start, initial
-                    # health starts below 100% based on start_life.
-                    laps_in_stint = max(0, lap - start_lap)
-                    effective_life_progress = max(0, (start_life - 1) + laps_in_stint)
-                    if expected_life > 1:
-                        health_pct = 100 - (effective_life_progress / (expected_life - 1)) * 100
-                    else:
-                        health_pct = 100.0
-                    plot_x.append(lap)
-                    plot_y.append(health_pct)
-
-            return plot_x, plot_y
-
-        # Compute the current max lap across all drivers for x-axis synchronization
-        max_lap = max((max(e['lap'] for e in entries) for entries in self.driver_data.values() if entries), default=0)
-
-        # If a single driver is selected, show only that driver
-        if self.current_driver and self.current_driver != "All Drivers":
-            driver = self.current_driver
-            entries = self.driver_data.get(driver, [])
-            px, py = compute_degradation_series(entries)
-            if px and py:
-                ax.plot(px, py, linewidth=2, color='tab:blue', label=driver)
-            ax.set_title(f'Tyre Degradation Analysis - {driver}')
-            ax.set_xlabel('Race Lap')
-            ax.set_ylabel('Tyre Health (%)')
-            ax.set_xlim(0, max_lap + 1)
-            ax.grid(True, alpha=0.3)
-            ax.legend()
-            self.figure.tight_layout()
+        needs_full_draw = False
+        if self._placeholder.get_visible():
+            self._placeholder.set_visible(False)
+            needs_full_draw = True
+
+        single = self.current_driver if self.current_driver != "All Drivers" else None
+        title = (f'Tyre Degradation Analysis - {single}' if single
+                 else 'Tyre Degradation Analysis - All Drivers')
+        if title != self.ax.get_title():
+            self.ax.set_title(title)
+            needs_full_draw = True
+
+        y_min = self.ax.get_ylim()[0]
+        with QMutexLocker(self._data_lock):
+            codes = sorted(self.driver_data.keys())
+        for driver in codes:
+            series = self._driver_series(driver)
+            px, py = series['px'], series['py']
+            line, label = self._get_driver_artists(driver)
+            visible = len(px) > 0 and (single is None or driver == single)
+            if visible:
+                line.set_data(px, py)
+                label.xy = (px[-1], py[-1])
+                y_min = min(y_min, series['y_min'])
+            if line.get_visible() != visible:
+                line.set_visible(visible)
+                label.set_visible(visible)
+
+        # Grow the static limits only when the data outruns them; limit
+        # changes are the only updates that need a full re-render, from which
+        # FuncAnimation re-captures its blitting background.
+        if self._max_lap + 1 > self.ax.get_xlim()[1]:
+            self.ax.set_xlim(0, self._max_lap + 1)
+            needs_full_draw = True
+        if y_min < self.ax.get_ylim()[0]:
+            self.ax.set_ylim(y_min - 5, 105)
+            needs_full_draw = True
+
+        if needs_full_draw:
+            # Render synchronously: FuncAnimation blits right after this step
+            # and re-captures its background from the canvas, so a deferred
+            # draw_idle would leave it blitting over a stale background (old
+            # ticks and limits) and skip the animated lines entirely until
+            # the next lap advance.
             self.canvas.draw()
-            return
 
-        # Otherwise plot all drivers
-        cmap = plt.get_cmap('tab10')
-        drivers_sorted = sorted(self.driver_data.keys())
-        plotted = False
-        for idx, driver in enumerate(drivers_sorted):
-            entries = self.driver_data.get(driver, [])
-            px, py = compute_degradation_series(entries)
-            if px and py:
-                color = cmap(idx % 10)
-                ax.plot(px, py, linewidth=1.5, color=color, label=driver, alpha=0.9)
-                plotted = True
-
-        if not plotted:
-            ax.text(0.5, 0.5, "No tyre data to plot yet", ha='center', va='center', transform=ax.transAxes)
-
-        ax.set_title('Tyre Degradation Analysis - All Drivers')
-        ax.set_xlabel('Race Lap')
-        ax.set_ylabel('Tyre Health (%)')
-        ax.set_xlim(0, max_lap + 1)
-        ax.grid(True, alpha=0.3)
-        ax.legend(loc='upper left', fontsize='small', ncol=2)
-        self.figure.tight_layout()
-        self.canvas.draw()
+        # FuncAnimation restores the cached background and blits these.
+        return self._visible_artists()
+
+    def _driver_series(self, code):
+        """Return the cached plot series for a driver, extended in place by
+        the samples that arrived since the previous update.
+
+        Data is append-only, so instead of re-scanning the whole buffer every
+        tick, the open stint's state is carried across calls and only the new
+        samples are folded in: O(new samples) per tick instead of O(N). A full
+        vectorized recompute happens only when the cache is missing or the
+        ring buffer overwrote samples the cache never saw.
+
+        Consecutive samples that map to the same (lap, health) point - i.e.
+        every in-lap telemetry frame - are deduplicated on append, keeping
+        the cached series O(laps) rather than O(frames) for the lifetime of
+        the session.
+        """
+        buffer = self.driver_data[code]
+        # Snapshot the write cursor once: the ingest worker keeps appending
+        # from its thread, and mixing fresh reads of buffer.total into the
+        # bookkeeping below would advance it past samples never folded in.
+        total = buffer.total
+        series = self._series_cache.get(code)
+        if series is None or total - series['total'] > min(total, buffer.cap):
+            # Derive the rebuild window from the same snapshot: reading the
+            # live view() here could include samples appended after it, which
+            # the next incremental update would then fold in a second time.
+            _, tyre, tyre_life, lap = buffer.since(max(0, total - buffer.cap),
+                                                   total)
+            px, py = self.compute_degradation_series(tyre, tyre_life, lap)
+            # The curve only moves at lap boundaries; collapse the runs of
+            # identical (lap, health) points the per-frame samples produce.
+            if len(px) > 1:
+                py = py.astype(np.float32)
+                keep = np.empty(len(px), dtype=bool)
+                keep[0] = True
+                keep[1:] = (px[1:] != px[:-1]) | (py[1:] != py[:-1])
+                px, py = px[keep], py[keep]
+            # Preallocate the output columns with headroom; the plotted
+            # views are zero-copy slices, so set_data never has to convert
+            # a Python list.
+            n = len(px)
+            cap = max(256, 2 * n)
+            x = np.empty(cap, dtype=np.int16)
+            y = np.empty(cap, dtype=np.float32)
+            x[:n] = px
+            y[:n] = py
+            series = self._series_cache[code] = {
+                'total': total,
+                'n': n,
+                'x': x,
+                'y': y,
+                'y_min': float(py.min()) if n else 105.0,
+                'stint': self._tail_stint_state(tyre, tyre_life, lap),
+            }
+            series['px'] = x[:n]
+            series['py'] = y[:n]
+            return series
+
+        new = total - series['total']
+        if new == 0:
+            return series
+
+        n = series['n']
+        x, y = series['x'], series['y']
+        if n + new > x.shape[0]:
+            # Grow geometrically; amortised O(1) per appended sample.
+            cap = max(2 * x.shape[0], n + new)
+            x = np.concatenate((x, np.empty(cap - x.shape[0], dtype=x.dtype)))
+            y = np.concatenate((y, np.empty(cap - y.shape[0], dtype=y.dtype)))
+            series['x'], series['y'] = x, y
+
+        compound, start_lap, start_life, prev_life = series['stint']
+        _, tyre, tyre_life, lap = buffer.since(series['total'], total)
+        for ty, tl, lp in zip(tyre, tyre_life, lap):
+            ty, tl, lp = int(ty), int(tl), int(lp)
+            if compound is None or compound != ty or tl < prev_life:
+                compound, start_lap, start_life = ty, lp, tl
+            laps_in_stint = max(0, lp - start_lap)
+            effective_life_progress = max(0, (start_life - 1) + laps_in_stint)
+            if 0 <= ty < len(self._exp_life_arr):
+                expected_life = int(self._exp_life_arr[ty])
+            else:
+                expected_life = 25
+            if expected_life > 1:
+                health_pct = 100 - (effective_life_progress / (expected_life - 1)) * 100
+            else:
+                health_pct = 100.0
+            health_pct = np.float32(health_pct)
+            prev_life = tl
+            # Skip in-lap frames that repeat the last plotted point, so the
+            # series grows with laps, not with telemetry frames.
+            if n > 0 and x[n - 1] == lp and y[n - 1] == health_pct:
+                continue
+            x[n] = lp
+            y[n] = health_pct
+            n += 1
+            if health_pct < series['y_min']:
+                series['y_min'] = float(health_pct)
+
+        series['n'] = n
+        series['total'] = total
+        series['stint'] = (compound, start_lap, start_life, prev_life)
+        series['px'] = x[:n]
+        series['py'] = y[:n]
+        return series
+
+    def _tail_stint_state(self, tyre, tyre_life, lap):
+        """Recover (compound, start_lap, start_life, prev_life) for the stint
+        open at the end of the given telemetry columns, so incremental
+        updates can continue it."""
+        if len(lap) == 0:
+            return (None, 0, 0, 0)
+        i = len(lap) - 1
+        while i > 0 and tyre[i] == tyre[i - 1] and tyre_life[i] >= tyre_life[i - 1]:
+            i -= 1
+        return (int(tyre[i]), int(lap[i]), int(tyre_life[i]), int(tyre_life[-1]))
+
+    def compute_degradation_series(self, tyre, tyre_life, lap):
+        """Compute plot points (laps, health %) from one driver's telemetry
+        columns (in insertion order; the stream delivers frames in order so
+        no sort is needed here).
+
+        Vectorized with NumPy: stint boundaries come from whole-array
+        comparisons and the health formula runs as array arithmetic instead
+        of a Python loop over every stored sample.
+        """
+        if len(lap) == 0:
+            return np.array([]), np.array([])
+
+        expected_lut = self._exp_life_arr
+        if HAS_NUMBA:
+            health_pct = np.empty(len(lap), dtype=np.float32)
+            _degradation_kernel(tyre, tyre_life, lap, expected_lut, health_pct)
+            return lap, health_pct
+
+        # Start a new stint when:
+        # 1) compound changes, or
+        # 2) tyre life resets/decreases (pit stop on same compound)
+        n = len(lap)
+        new_stint = np.empty(n, dtype=bool)
+        new_stint[0] = True
+        new_stint[1:] = (tyre[1:] != tyre[:-1]) | (tyre_life[1:] < tyre_life[:-1])
+
+        # Broadcast each stint's starting lap/life to every point in the stint.
+        start_idx = np.maximum.accumulate(np.where(new_stint, np.arange(n), 0))
+        start_lap = lap[start_idx]
+        start_life = tyre_life[start_idx]
+        expected_life = np.where((tyre >= 0) & (tyre < len(expected_lut)),
+                                 expected_lut[np.clip(tyre, 0, len(expected_lut) - 1)],
+                                 np.int16(25))
+
+        # Degrade health by race laps completed in this stint so the curve
+        # decreases gradually lap-by-lap. If the tyre is already used at
+        # stint start, initial health starts below 100% based on start_life.
+        # Promote to wider types only where the arithmetic needs it; the
+        # narrow buffer columns stay untouched.
+        laps_in_stint = np.maximum(0, lap.astype(np.int32) - start_lap)
+        effective_life_progress = np.maximum(0, (start_life.astype(np.int32) - 1) + laps_in_stint)
+        # Compute in float64 and round to float32 once at the end, exactly
+        # like the incremental path and the Numba kernel do; rounding every
+        # intermediate instead drifts by 1 ULP and breaks the dedupe.
+        health_pct = np.where(
+            expected_life > 1,
+            100.0 - effective_life_progress.astype(np.float64)
+            / np.maximum(expected_life - 1, 1) * 100.0,
+            100.0).astype(np.float32)
+
+        return lap, health_pct
+
 
 
 def main():